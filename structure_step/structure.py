@@ -5,9 +5,7 @@
 
 import logging
 from pathlib import Path
-import pkg_resources
 import pprint  # noqa: F401
-import sys
 import time
 
 from tabulate import tabulate
@@ -33,11 +31,22 @@ logger = logging.getLogger(__name__)
 job = printing.getPrinter()
 printer = printing.getPrinter("Structure")
 
-# Add this module's properties to the standard properties
-path = Path(pkg_resources.resource_filename(__name__, "data/"))
-csv_file = path / "properties.csv"
-if path.exists():
-    molsystem.add_properties_from_file(csv_file)
+_properties_loaded = False
+
+
+def _ensure_properties():
+    """Add this module's properties to the standard properties.
+
+    This is done the first time a Structure step is created rather than on
+    import, so that simply importing the module stays cheap.
+    """
+    global _properties_loaded
+    if _properties_loaded:
+        return
+    csv_file = Path(__file__).parent / "data" / "properties.csv"
+    if csv_file.is_file():
+        molsystem.add_properties_from_file(csv_file)
+    _properties_loaded = True
 
 
 class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
@@ -93,7 +102,9 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
         -------
         None
         """
-        logger.debug(f"Creating Structure {self}")
+        _ensure_properties()
+
+        logger.debug("Creating Structure %s", self)
         self.subflowchart = seamm.Flowchart(
             parent=self, name="Structure", namespace=namespace
         )
@@ -115,6 +126,7 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
         self._data = {}
         self._results = {}
         self._logfile = None
+        self._ordered_nodes = None
 
     @property
     def version(self):
@@ -170,11 +182,7 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
             tablefmt="rounded_outline",
         )
         length = len(tmp.splitlines()[0])
-        text = "\n"
-        text += "Optimization results".center(length)
-        text += "\n"
-        text += tmp
-        text += "\n"
+        text = "\n".join(("", "Optimization results".center(length), tmp, ""))
         printer.important(__(text, indent=11 * " ", wrap=False, dedent=False))
 
     def create_parser(self):
@@ -241,7 +249,11 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
                 text += "{optimizer} optimizer, converging to {convergence} "
 
             max_steps = P["max steps"]
-            if natoms is not None and "natoms" in max_steps:
+            if (
+                natoms is not None
+                and isinstance(max_steps, str)
+                and "natoms" in max_steps
+            ):
                 tmp = max_steps.split()
                 if "natoms" in tmp[0]:
                     max_steps = int(tmp[1]) * natoms
@@ -262,37 +274,65 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
         self.subflowchart.in_jobserver = self.subflowchart.in_jobserver
 
         if not short:
-            # Get the first real node
-            node = self.subflowchart.get_node("1").next()
             result += "\n\n    The energy and forces will be calculated as follows:\n"
 
             # Now walk through the steps in the subflowchart...
-            while node is not None:
+            descriptions = []
+            for node in self._iter_nodes():
                 try:
-                    result += str(
-                        __(node.description_text(), indent=7 * " ", wrap=False)
+                    descriptions.append(
+                        str(__(node.description_text(), indent=7 * " ", wrap=False))
                     )
-                except Exception as e:
-                    print(f"Error describing structure flowchart: {e} in {node}")
+                except Exception:
                     self.logger.critical(
-                        f"Error describing structure flowchart: {e} in {node}"
+                        "Error describing structure flowchart in %s",
+                        node,
+                        exc_info=True,
                     )
                     raise
-                except:  # noqa: E722
-                    print(
-                        "Unexpected error describing structure flowchart: "
-                        f"{sys.exc_info()[0]} in {str(node)}"
-                    )
-                    self.logger.critical(
-                        "Unexpected error describing structure flowchart: "
-                        f"{sys.exc_info()[0]} in {str(node)}"
-                    )
-                    raise
-                result += "\n"
-                node = node.next()
+            result += "".join(f"{d}\n" for d in descriptions)
 
         return result
 
+    def from_dict(self, data):
+        """Restore this step, and its subflowchart, from a dict.
+
+        Restoring recreates the nodes in the subflowchart, so the cached list
+        of nodes is reset.
+
+        Parameters
+        ----------
+        data : dict
+            The serialized form of the step, from :meth:`to_dict`.
+        """
+        super().from_dict(data)
+        self.reset_node_cache()
+
+    def reset_node_cache(self):
+        """Forget the cached list of nodes in the subflowchart."""
+        self._ordered_nodes = None
+
+    def _iter_nodes(self):
+        """The nodes of the subflowchart, in order, excluding the start node.
+
+        The list is only used for the full description of the step. It is
+        cached until the subflowchart is renumbered, restored with
+        :meth:`from_dict`, or edited in the dialog.
+
+        Returns
+        -------
+        [seamm.Node]
+            The nodes in the subflowchart.
+        """
+        if self._ordered_nodes is None:
+            nodes = []
+            node = self.subflowchart.get_node("1").next()
+            while node is not None:
+                nodes.append(node)
+                node = node.next()
+            self._ordered_nodes = nodes
+        return self._ordered_nodes
+
     def plot(self, E_units="", F_units=""):
         """Generate a plot of the convergence of the geometry optimization."""
         figure = self.create_figure(
@@ -458,7 +498,7 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
 
     def set_id(self, node_id=()):
         """Sequentially number the subnodes"""
-        self.logger.debug("Setting ids for subflowchart {}".format(self))
+        self.logger.debug("Setting ids for subflowchart %s", self)
         if self.visited:
             return None
         else:
@@ -469,6 +509,8 @@ class Structure(seamm.Node, ASE_mixin, geomeTRIC_mixin):
 
     def set_subids(self, node_id=()):
         """Set the ids of the nodes in the subflowchart"""
+        # The subflowchart may have been edited, so forget the cached nodes
+        self.reset_node_cache()
         self.subflowchart.reset_visited()
         node = self.subflowchart.get_node("1").next()
         n = 1
@@ -83,6 +83,7 @@ class TkStructure(seamm.TkNode):
         """
         self.namespace = namespace
         self.dialog = None
+        self._last_layout_key = None
 
         super().__init__(
             tk_flowchart=tk_flowchart,
@@ -113,6 +114,9 @@ class TkStructure(seamm.TkNode):
         --------
         TkStructure.reset_dialog
         """
+        # The dialog only needs to be built once
+        if self.dialog is not None:
+            return
 
         frame = super().create_dialog(title="Structure", widget="notebook")
         # make it large!
@@ -169,7 +173,10 @@ class TkStructure(seamm.TkNode):
             "convergence formula",
             "convergence",
         ):
-            self[key].combobox.bind("<<ComboboxSelected>>", self.reset_structure_frame)
+            self[key].combobox.bind(
+                "<<ComboboxSelected>>",
+                lambda event: self.dialog.after_idle(self.reset_structure_frame),
+            )
 
         # structure handling frame to isolate widgets
         frame = self["handling frame"] = ttk.LabelFrame(
@@ -195,6 +202,25 @@ class TkStructure(seamm.TkNode):
 
         self.setup_results()
 
+    def handle_dialog(self, result):
+        """Handle the closing of the edit dialog.
+
+        The subflowchart may have been edited, so the node's cached list
+        of subnodes is reset.
+
+        Parameters
+        ----------
+        result : None or str
+            The value of this variable depends on what the button
+            the user clicked.
+
+        Returns
+        -------
+        None
+        """
+        super().handle_dialog(result)
+        self.node.reset_node_cache()
+
     def reset_dialog(self, widget=None):
         """Layout the widgets in the dialog.
 
@@ -239,6 +265,10 @@ class TkStructure(seamm.TkNode):
         """Layout the widgets in the structure frame
         as needed for the current state"""
 
+        # Only redo the layout if one of the controlling values has changed
+        if self._layout_key() == self._last_layout_key:
+            return
+
         target = self["target"].get()
         approach = self["approach"].get()
 
@@ -351,6 +381,22 @@ class TkStructure(seamm.TkNode):
         w2 = sw.align_labels(widgets2, sticky=tk.E)
         frame.columnconfigure(0, minsize=w1 - w2 + 50)
 
+        self._last_layout_key = self._layout_key()
+
+    def _layout_key(self):
+        """The values of the widgets that control the layout of the structure
+        frame."""
+        return tuple(
+            self[key].get()
+            for key in (
+                "target",
+                "approach",
+                "optimizer",
+                "convergence",
+                "convergence formula",
+            )
+        )
+
     def right_click(self, event):
         """
         Handles the right click event on the node.
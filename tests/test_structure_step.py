@@ -4,6 +4,7 @@
 """Tests for `structure_step` package."""
 
 import pytest  # noqa: F401
+import seamm
 import structure_step  # noqa: F401
 
 
@@ -11,3 +12,105 @@ def test_construction():
     """Just create an object and test its type."""
     result = structure_step.Structure()
     assert str(type(result)) == "<class 'structure_step.structure.Structure'>"
+
+
+class _Substep(seamm.Node):
+    """A minimal step for the subflowchart that describes itself by title."""
+
+    def description_text(self, P=None):
+        return self.title
+
+
+def _flowchart_with_structure():
+    """A flowchart with a Structure step whose subflowchart holds one step."""
+    flowchart = seamm.Flowchart()
+    structure = structure_step.Structure(flowchart=flowchart)
+    flowchart.add_node(structure)
+    flowchart.add_edge(flowchart.get_node("1"), structure)
+
+    subflowchart = structure.subflowchart
+    first = _Substep(flowchart=subflowchart, title="First substep")
+    subflowchart.add_node(first)
+    subflowchart.add_edge(subflowchart.get_node("1"), first)
+    flowchart.set_ids()
+
+    P = structure.parameters.values_to_dict()
+    P["convergence formula"] = "E+grad+step"
+    return flowchart, structure, first, P
+
+
+def _add_second_substep(structure, first):
+    subflowchart = structure.subflowchart
+    second = _Substep(flowchart=subflowchart, title="Second substep")
+    subflowchart.add_node(second)
+    subflowchart.add_edge(first, second)
+
+
+def test_description_after_set_ids():
+    """set_ids picks up steps added to the subflowchart."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    assert "First substep" in structure.description_text(P)
+
+    _add_second_substep(structure, first)
+    flowchart.set_ids()
+    text = structure.description_text(P)
+    assert "First substep" in text
+    assert "Second substep" in text
+
+
+def test_description_after_reset_node_cache():
+    """reset_node_cache picks up steps added to the subflowchart."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    assert "Second substep" not in structure.description_text(P)
+
+    _add_second_substep(structure, first)
+    structure.reset_node_cache()
+    assert "Second substep" in structure.description_text(P)
+
+
+@pytest.mark.parametrize(
+    "max_steps, expected",
+    [
+        ("6 * natoms", "60"),
+        ("12 * natoms", "120"),
+        ("18 * natoms", "180"),
+        ("12 natoms", "120"),
+        ("12 *natoms", "120"),
+        ("natoms 6", "60"),
+    ],
+)
+def test_description_max_steps(max_steps, expected):
+    """The maximum number of steps is given in terms of the number of atoms."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    P["max steps"] = max_steps
+    text = structure.description_text(P, short=True, natoms=10)
+    assert f"maximum of {expected} steps" in text
+
+
+def test_description_max_steps_integer():
+    """An integer maximum number of steps is described as given."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    P["max steps"] = 100
+    text = structure.description_text(P, short=True, natoms=10)
+    assert "maximum of 100 steps" in text
+
+
+@pytest.mark.parametrize(
+    "max_steps", ["natoms / 2", "1.5 * natoms", "natoms * 6", "12*natoms"]
+)
+def test_description_max_steps_unsupported(max_steps):
+    """Forms the optimizers cannot use are rejected, as they are when run."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    P["max steps"] = max_steps
+    with pytest.raises((ValueError, IndexError)):
+        structure.description_text(P, short=True, natoms=10)
+
+
+def test_description_after_from_dict():
+    """Restoring the step from a dict picks up its new subflowchart."""
+    flowchart, structure, first, P = _flowchart_with_structure()
+    assert "First substep" in structure.description_text(P)
+
+    other = structure_step.Structure(flowchart=seamm.Flowchart())
+    structure.from_dict(other.to_dict())
+    assert "First substep" not in structure.description_text(P)